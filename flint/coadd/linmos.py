@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from argparse import ArgumentParser
 from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Literal, NamedTuple
 
@@ -84,7 +86,8 @@ class LinmosParsetSummary(NamedTuple):
 
 
 def _create_bound_box_plane(
-    image_data: np.ndarray, is_masked: bool = False
+    image_data: np.ndarray,
+    is_masked: bool = False,
 ) -> BoundingBox | None:
     """Create a bounding box around pixels in a 2D image. If all
     pixels are not valid, then ``None`` is returned.
@@ -103,23 +106,95 @@ def _create_bound_box_plane(
     # First convert to a boolean array
     image_valid = image_data if is_masked else np.isfinite(image_data)
 
-    if not any(image_valid.reshape(-1)):
+    # Then make them 1D arrays. The emptiness test falls out of the row
+    # projection, so no separate whole-image scan is needed.
+    x_valid = np.any(image_valid, axis=1)
+
+    if not x_valid.any():
         logger.info("No pixels to creating bounding box for")
         return None
 
-    # Then make them 1D arrays
-    x_valid = np.any(image_valid, axis=1)
     y_valid = np.any(image_valid, axis=0)
 
-    # Now get the first and last index
-    xmin, xmax = np.where(x_valid)[0][[0, -1]]
-    ymin, ymax = np.where(y_valid)[0][[0, -1]]
+    # Now get the first and last index. argmax short-circuits on the first
+    # True and returns a scalar, where np.where would materialise an index
+    # array of every valid position. The reversed slices are views.
+    xmin = int(np.argmax(x_valid))
+    xmax = len(x_valid) - 1 - int(np.argmax(x_valid[::-1]))
+    ymin = int(np.argmax(y_valid))
+    ymax = len(y_valid) - 1 - int(np.argmax(y_valid[::-1]))
 
     return BoundingBox(
         xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax, original_shape=image_data.shape[-2:]
     )
 
 
+def _collapse_valid_mask(
+    reshaped_image_data: np.ndarray,
+    is_masked: bool = False,
+    block_rows: int | None = None,
+    block_planes: int = 4,
+    block_bytes: int = 4 * 1024 * 1024,
+) -> np.ndarray:
+    """Collapse a ``(plane, height, width)`` stack of planes into a single
+    2D validity mask, where a pixel is valid if it is valid in any plane.
+
+    The ``isfinite`` test is evaluated in blocks of rows with a reusable
+    scratch buffer so that the full cube-sized boolean temporary is never
+    materialised. Planes are folded in in small groups, and since the
+    union mask only ever grows the remaining planes are skipped entirely
+    once every pixel has been marked valid.
+
+    Args:
+        reshaped_image_data (np.ndarray): Data of shape (plane, height, width) to collapse
+        is_masked (bool, optional): Whether the data are already boolean-like masks. Defaults to False.
+        block_rows (Optional[int], optional): Number of image rows to process per block. If None it is derived from ``block_bytes``. Defaults to None.
+        block_planes (int, optional): Number of planes to fold into the mask per pass. Defaults to 4.
+        block_bytes (int, optional): Target size of each block in bytes, used to derive ``block_rows`` so blocks stay cache resident. Defaults to 4MB.
+
+    Returns:
+        np.ndarray: A 2D boolean array marking valid pixels
+    """
+    if is_masked:
+        return np.any(reshaped_image_data, axis=0)
+
+    no_planes, height, width = reshaped_image_data.shape
+
+    if block_rows is None:
+        # Size the block so a single pass stays cache resident no matter
+        # the image width or element size
+        bytes_per_row = (
+            width * reshaped_image_data.itemsize * min(block_planes, no_planes)
+        )
+        block_rows = min(height, max(1, block_bytes // bytes_per_row))
+    collapsed_valid = np.zeros((height, width), dtype=bool)
+    finite_buffer = np.empty(
+        (min(block_planes, no_planes), min(block_rows, height), width), dtype=bool
+    )
+
+    for plane_start in range(0, no_planes, block_planes):
+        plane_block = reshaped_image_data[plane_start : plane_start + block_planes]
+
+        for row_start in range(0, height, block_rows):
+            block = plane_block[:, row_start : row_start + block_rows]
+            block_finite = np.isfinite(
+                block, out=finite_buffer[: block.shape[0], : block.shape[1]]
+            )
+            collapsed_valid[row_start : row_start + block.shape[1]] |= np.any(
+                block_finite, axis=0
+            )
+
+        # The union mask can only grow, so once saturated no remaining
+        # plane can change the bounding box
+        if plane_start + block_planes < no_planes and collapsed_valid.all():
+            logger.info(
+                f"Valid pixel mask saturated after {plane_start + block_planes} planes. Skipping the rest."
+            )
+            break
+
+    return collapsed_valid
+
+
 def create_bound_box(image_data: np.ndarray, is_masked: bool = False) -> BoundingBox:
     """Construct a bounding box around finite pixels for a 2D image.
 
@@ -140,13 +215,17 @@ def create_bound_box(image_data: np.ndarray, is_masked: bool = False) -> Boundin
     reshaped_image_data = image_data.reshape((-1, *image_data.shape[-2:]))
     logger.info(f"New image shape {reshaped_image_data.shape} from {image_data.shape}")
 
-    bounding_boxes = [
-        _create_bound_box_plane(image_data=image, is_masked=is_masked)
-        for image in reshaped_image_data
-    ]
-    bounding_boxes = [bb for bb in bounding_boxes if bb is not None]
+    # Collapse the non-spatial axes with a single reduction. A pixel is valid
+    # if it is valid in any plane, so the union bounding box of the cube is
+    # simply the bounding box of this collapsed mask. This streams the data
+    # once rather than once per plane.
+    collapsed_valid = _collapse_valid_mask(
+        reshaped_image_data=reshaped_image_data, is_masked=is_masked
+    )
 
-    if len(bounding_boxes) == 0:
+    bounding_box = _create_bound_box_plane(image_data=collapsed_valid, is_masked=True)
+
+    if bounding_box is None:
         logger.info("No valid bounding box found. Constructing one for all pixels")
         return BoundingBox(
             xmin=0,
@@ -155,25 +234,8 @@ def create_bound_box(image_data: np.ndarray, is_masked: bool = False) -> Boundin
             ymax=image_data.shape[-2] - 1,
             original_shape=tuple(image_data.shape[-2:]),  # type: ignore
         )
-    elif len(bounding_boxes) == 1:
-        assert bounding_boxes[0] is not None, "This should not happen"
-        return bounding_boxes[0]
-
-    assert all([bb is not None for bb in bounding_boxes])
-
-    logger.info(
-        f"Boounding boxes across {len(bounding_boxes)} constructed. Finsing limits. "
-    )
-    # The type ignores below are to avoid mypy believe bound_boxes could
-    # include None. The above checks should be sufficient
-    xmin = min([bb.xmin for bb in bounding_boxes])  # type: ignore
-    xmax = max([bb.xmax for bb in bounding_boxes])  # type: ignore
-    ymin = min([bb.ymin for bb in bounding_boxes])  # type: ignore
-    ymax = max([bb.ymax for bb in bounding_boxes])  # type: ignore
 
-    return BoundingBox(
-        xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax, original_shape=image_data.shape
-    )
+    return bounding_box
 
 
 class TrimImageResult(NamedTuple):
@@ -200,49 +262,76 @@ def trim_fits_image(
         Path: Path of the FITS image that had its border trimmed
     """
     logger.info(f"Trimming {image_path.name}")
-    with fits.open(image_path) as fits_image:
+    with fits.open(image_path, mode="update", memmap=True) as fits_image:
         data = fits_image[0].data  # type: ignore
         logger.info(f"Original data shape: {data.shape}")
 
+        image_shape = data.shape[-2:]
+        logger.info(f"The image dimensions are: {image_shape}")
+
+        if bounding_box and image_shape != bounding_box.original_shape[-2:]:
+            raise ValueError(
+                f"Bounding box constructed against {bounding_box.original_shape}, but being applied to {image_shape=}"
+            )
+
         # 0.0 is not a real number, blank them out so the border
         # can be computed and trimmed correctly.
         logger.info("Blanking pixels with values of 0.0.")
         data[data == 0.0] = np.nan
 
-        image_shape = data.shape[-2:]
-        logger.info(f"The image dimensions are: {image_shape}")
-
         if not bounding_box:
             logger.info("Constructing a new bounding box")
-            bounding_box = create_bound_box(
-                image_data=np.squeeze(data), is_masked=False
-            )
+            # No squeeze needed - create_bound_box collapses the
+            # non-spatial axes itself, and handing it the raw (possibly
+            # memmapped) data keeps the internal reshape a view
+            bounding_box = create_bound_box(image_data=data, is_masked=False)
             logger.info(f"Constructed {bounding_box=}")
-        else:
-            if image_shape != bounding_box.original_shape[-2:]:
-                raise ValueError(
-                    f"Bounding box constructed against {bounding_box.original_shape}, but being applied to {image_shape=}"
-                )
 
-        data = data[
-            ...,
-            bounding_box.xmin : bounding_box.xmax,
-            bounding_box.ymin : bounding_box.ymax,
-        ]
+        # Replacing the HDU data and flushing on exit rewrites the file in
+        # place, avoiding the full read-then-writeto round trip of a
+        # separate output buffer
+        fits_image[0].data = np.ascontiguousarray(  # type: ignore
+            data[
+                ...,
+                bounding_box.xmin : bounding_box.xmax,
+                bounding_box.ymin : bounding_box.ymax,
+            ]
+        )
 
         header = fits_image[0].header  # type: ignore
         header["CRPIX1"] -= bounding_box.ymin
         header["CRPIX2"] -= bounding_box.xmin
 
-        logger.info(f"Trimmed data shape: {data.shape}")
-
-    fits.writeto(filename=image_path, data=data, header=header, overwrite=True)
+        logger.info(f"Trimmed data shape: {fits_image[0].data.shape}")  # type: ignore
 
     return TrimImageResult(path=image_path, bounding_box=bounding_box)
 
 
+def _inplace_median(values: np.ndarray) -> float:
+    """Compute the median of a 1D array using an in-place partition. This
+    is an O(n) selection rather than the O(n log n) sort that backs
+    ``np.median``, and allocates no temporary. The ordering of ``values``
+    is modified in place.
+
+    Args:
+        values (np.ndarray): The 1D array to compute the median of
+
+    Returns:
+        float: The median value
+    """
+    pivot = values.size // 2
+    if values.size % 2 == 1:
+        values.partition(pivot)
+        return float(values[pivot])
+
+    values.partition((pivot - 1, pivot))
+    return float(values[pivot - 1] + values[pivot]) / 2.0
+
+
 def _get_image_weight_plane(
-    image_data: np.ndarray, mode: Literal["std", "mad"] = "mad", stride: int = 4
+    image_data: np.ndarray,
+    mode: Literal["std", "mad"] = "mad",
+    stride: int = 4,
 ) -> float:
     """Extract the inverse variance weight for an input plane of data
 
@@ -265,19 +354,40 @@ def _get_image_weight_plane(
         f"Invalid {mode=} specified. Available modes: {weight_modes}"
     )
 
-    # remove non-finite numbers that would ruin the statistic
-    image_data = image_data[np.isfinite(image_data)][::stride]
+    # Stride first (a zero-copy view) so the finite test and the fancy-index
+    # copy only touch the pixels that will actually be kept, then remove
+    # non-finite numbers that would ruin the statistic
+    strided_data = image_data.reshape(-1)[::stride]
+    strided_mask = np.isfinite(strided_data)
+    image_data = strided_data[strided_mask]
 
     if np.all(~np.isfinite(image_data)):
         return 0.0
 
+    # The weights are relative between images, so float32 precision is
+    # plenty. Halving the element size halves the bandwidth of the
+    # reductions below, and linmos images are float32 on disk anyway
+    # (making this a no-copy pass-through in the usual case).
+    image_data = image_data.astype(np.float32, copy=False)
+
     if mode == "mad":
-        median = np.median(image_data)
-        mad = np.median(np.abs(image_data - median))
+        # The filtered data above are a fresh copy, so the in-place
+        # partitioning and deviation computation are safe to do here
+        median = _inplace_median(image_data)
+        np.subtract(image_data, median, out=image_data)
+        np.abs(image_data, out=image_data)
+        mad = _inplace_median(image_data)
         weight = 1.0 / mad**2
     elif mode == "std":
-        std = np.std(image_data)
-        weight = 1.0 / std**2
+        # Centre the (owned) data in place first - the E[x^2] - E[x]^2 form
+        # cancels catastrophically in float32 when the mean dwarfs the
+        # spread. np.dot on the centred values routes through BLAS and
+        # allocates no (x - mean)**2 temporary, unlike np.std
+        no_pixels = image_data.size
+        mean = image_data.sum(dtype=np.float64) / no_pixels
+        np.subtract(image_data, np.float32(mean), out=image_data)
+        variance = np.dot(image_data, image_data) / no_pixels
+        weight = 1.0 / variance
     else:
         raise ValueError(f"Invalid {mode=} specified. Available modes: {weight_modes}")
 
@@ -319,7 +429,17 @@ def get_image_weight(
     )
 
     weights: list[float] = []
-    with fits.open(image_path, memmap=True) as in_fits:
+    # do_not_scale_image_data stops astropy from converting the mapped data
+    # on access, which would otherwise allocate a scaled copy of the full
+    # cube and defeat the memmap. Each plane is paged in as it is touched.
+    # lazy_load_hdus defers parsing of sibling HDUs that are never used.
+    with fits.open(
+        image_path,
+        mode="readonly",
+        memmap=True,
+        do_not_scale_image_data=True,
+        lazy_load_hdus=True,
+    ) as in_fits:
         image_data = in_fits[image_slice].data  # type: ignore
 
         assert len(image_data.shape) >= 2, (
@@ -337,15 +457,56 @@ def get_image_weight(
             f"Expected to have shape (chan, dec, ra), got {image_data.shape}"
         )
 
-        for idx, chan_image_data in enumerate(image_data):
-            weight = _get_image_weight_plane(image_data=chan_image_data, stride=stride)
-            logger.info(f"Channel {idx} {weight=:.3f} for {image_path}")
+        # Each channel is independent, and the numpy reductions release the
+        # GIL, so fan the per-channel statistics out across threads
+        with ThreadPoolExecutor() as executor:
+            channel_weights = executor.map(
+                partial(_get_image_weight_plane, stride=stride), image_data
+            )
+            for idx, weight in enumerate(channel_weights):
+                logger.info(f"Channel {idx} {weight=:.3f} for {image_path}")
 
-            weights.append(weight)
+                weights.append(weight)
 
     return weights
 
 
+def _compute_and_write_weights(
+    image_path: Path, mode: str = "mad", stride: int = 1
+) -> Path:
+    """Compute the per-channel weights of a single image and write them to
+    its corresponding ``.weights.txt`` file.
+
+    Args:
+        image_path (Path): The image to compute weights for
+        mode (str, optional): The mode to use when calling get_image_weight. Defaults to "mad".
+        stride (int, optional): Include every n'th pixel when computing the weight. '1' includes all pixels. Defaults to 1.
+
+    Returns:
+        Path: The weights text file created alongside the image
+    """
+    weight_file = image_path.with_suffix(".weights.txt")
+
+    # Must be of the format:
+    # #Channel Weight
+    # 0 1234.5
+    # 1 6789.0
+    with open(weight_file, "w", buffering=65536) as out_file:
+        logger.info(f"Writing {weight_file}")
+        out_file.write("#Channel Weight\n")
+        image_weights = get_image_weight(
+            image_path=image_path, mode=mode, stride=stride
+        )
+        # Each line carries its newline so the file ends with one, which
+        # is required for linmos to properly process weights. writelines
+        # drains the generator without building the joined string.
+        out_file.writelines(
+            f"{idx} {weight}\n" for idx, weight in enumerate(image_weights)
+        )
+
+    return weight_file
+
+
 def generate_weights_list_and_files(
     image_paths: Collection[Path], mode: str = "mad", stride: int = 1
 ) -> tuple[Path, ...]:
@@ -381,24 +542,18 @@ def generate_weights_list_and_files(
 
     # TODO: image cubes should be supported here. This would required iterating
     # over each channel in the FITS cube.
-    weight_file_list = []
-    for image in image_paths:
-        weight_file = image.with_suffix(".weights.txt")
-        weight_file_list.append(weight_file)
-
-        # Must be of the format:
-        # #Channel Weight
-        # 0 1234.5
-        # 1 6789.0
-        with open(weight_file, "w") as out_file:
-            logger.info(f"Writing {weight_file}")
-            out_file.write("#Channel Weight\n")
-            image_weights = get_image_weight(image_path=image, mode=mode, stride=stride)
-            weights = "\n".join(
-                [f"{idx} {weight}" for idx, weight in enumerate(image_weights)]
+    # Each image is independent, so fan the per-image computation out across
+    # threads. The numpy reductions release the GIL, and threads (unlike a
+    # process pool) are safe on the daemonic dask workers this runs on via
+    # prefect. Results come back in input order so the weight files line
+    # up with the input images.
+    with ThreadPoolExecutor() as executor:
+        weight_file_list = list(
+            executor.map(
+                partial(_compute_and_write_weights, mode=mode, stride=stride),
+                image_paths,
             )
-            out_file.write(weights)
-            out_file.write("\n")  # Required for linmos to properly process weights
+        )
 
     return tuple(weight_file_list)
 
@@ -468,32 +623,42 @@ def _get_holography_linmos_options(
     logger.info(f"Using holography file {holofile} -- setting removeleakge to true")
     assert holofile.exists(), f"{holofile=} has been specified but does not exist. "
 
-    parset = (
-        f"linmos.primarybeam      = ASKAP_PB\n"
-        f"linmos.primarybeam.ASKAP_PB.image = {holofile.absolute()!s}\n"
-        f"linmos.removeleakage    = {'true' if remove_leakage else 'false'}\n"
-    )
-    parset += _get_alpha_linmos_option(pol_axis=pol_axis)
+    parset_parts: list[str] = [
+        "linmos.primarybeam      = ASKAP_PB\n",
+        f"linmos.primarybeam.ASKAP_PB.image = {holofile.absolute()!s}\n",
+        f"linmos.removeleakage    = {'true' if remove_leakage else 'false'}\n",
+        _get_alpha_linmos_option(pol_axis=pol_axis),
+    ]
 
     if stokesi_images is not None:
         logger.info("Stokes I images provided. Adding to linmos parset.")
         stokesi_list = _file_list_to_string(stokesi_images)
-        parset += f"linmos.stokesinames = {stokesi_list}\n"
+        parset_parts.append(f"linmos.stokesinames = {stokesi_list}\n")
 
-    return parset
+    return "".join(parset_parts)
 
 
 def _file_list_to_string(file_list: Collection[Path]) -> str:
-    img_str: list[str] = list(
-        [str(p).replace(".fits", "") for p in file_list if p.exists()]
-    )
+    # Each .exists() is a stat syscall that releases the GIL. On network
+    # file systems these round trips dominate, so issue them concurrently.
+    with ThreadPoolExecutor() as executor:
+        exists_flags = list(executor.map(Path.exists, file_list))
+
+    # with_suffix only drops the trailing extension, avoiding the substring
+    # scan (and any mid-name '.fits' match) of str.replace
+    img_str: list[str] = [
+        str(p.with_suffix("")) if p.suffix == ".fits" else str(p)
+        for p, exists in zip(file_list, exists_flags)
+        if exists
+    ]
+    unique_images = set(img_str)
     logger.info(
-        f"{len(img_str)} unique images from {len(file_list)} input collection. "
+        f"{len(unique_images)} unique images from {len(file_list)} input collection. "
     )
     img_list: str = "[" + ",".join(img_str) + "]"
 
-    assert len(set(img_str)) == len(file_list), (
-        f"Some images were dropped from the linmos image string (found {len(set(img_str))}, expcected {len(file_list)}). Walk the plank. "
+    assert len(unique_images) == len(file_list), (
+        f"Some images were dropped from the linmos image string (found {len(unique_images)}, expcected {len(file_list)}). Walk the plank. "
     )
 
     return img_list
@@ -550,24 +715,23 @@ def generate_linmos_parameter_set(
     # attribute drops the parent directory (absolute directory).
     parent_dir = linmos_names.image_fits.parent
 
-    # TODO: This should be a list of one line strings that is grown based on
-    # options provided, then joined with a "\n".join(parset)
-    # Parameters are taken from arrakis
-    parset = (
-        f"linmos.names            = {img_list}\n"
-        f"linmos.weights          = {weight_str}\n"
-        f"linmos.beams            = {beam_order_list}\n"
-        # f"linmos.beamangle        = {beam_angle_list}\n"
-        f"linmos.imagetype        = fits\n"
-        f"linmos.outname          = {parent_dir / linmos_names.image_fits.stem!s}\n"
-        f"linmos.outweight        = {parent_dir / linmos_names.weight_fits.stem!s}\n"
-        f"# For ASKAPsoft>1.3.0\n"
-        f"linmos.useweightslog    = true\n"
-        f"linmos.weighttype       = Combined\n"
-        f"linmos.weightstate      = Inherent\n"
-        f"linmos.cutoff           = {linmos_options.cutoff}\n"  # This `cutoff` is based on weights per-beam, and when COMBINED is the ON-cutoff
-        f"linmos.finalcutoff           = 0.0\n"  # This one is applied to the set of final co-added field weightds
-    )
+    # Lines are grown in a list based on the options provided, then joined
+    # once at write time. Parameters are taken from arrakis
+    parset_parts: list[str] = [
+        f"linmos.names            = {img_list}\n",
+        f"linmos.weights          = {weight_str}\n",
+        f"linmos.beams            = {beam_order_list}\n",
+        # f"linmos.beamangle        = {beam_angle_list}\n",
+        "linmos.imagetype        = fits\n",
+        f"linmos.outname          = {parent_dir / linmos_names.image_fits.stem!s}\n",
+        f"linmos.outweight        = {parent_dir / linmos_names.weight_fits.stem!s}\n",
+        "# For ASKAPsoft>1.3.0\n",
+        "linmos.useweightslog    = true\n",
+        "linmos.weighttype       = Combined\n",
+        "linmos.weightstate      = Inherent\n",
+        f"linmos.cutoff           = {linmos_options.cutoff}\n",  # This `cutoff` is based on weights per-beam, and when COMBINED is the ON-cutoff
+        "linmos.finalcutoff           = 0.0\n",  # This one is applied to the set of final co-added field weightds
+    ]
     # NOTE; The yandasoft linmos task implements inverse variance weighting when the weighttype=combined.
     # Internally an array is constructed as: pb*pb*wt. Here the `wt` are the weighting terms constructed
     # per image by `generate_weight_list_and)files`. The weight returned there is 1/rms**2. T%he cutoff
@@ -588,12 +752,15 @@ def generate_linmos_parameter_set(
         )
         remove_leakage = linmos_options.force_remove_leakage
 
-    parset += _get_holography_linmos_options(
-        holofile=linmos_options.holofile,
-        pol_axis=linmos_options.pol_axis,
-        remove_leakage=remove_leakage,
-        stokesi_images=linmos_options.stokesi_images,
+    parset_parts.append(
+        _get_holography_linmos_options(
+            holofile=linmos_options.holofile,
+            pol_axis=linmos_options.pol_axis,
+            remove_leakage=remove_leakage,
+            stokesi_images=linmos_options.stokesi_images,
+        )
     )
+    parset = "".join(parset_parts)
 
     # Now write the file, me hearty
     logger.info(f"Writing parset to {linmos_names.parset_output_path!s}.")
@@ -688,10 +855,15 @@ def linmos_images(
         weight_fits=linmos_names.weight_fits.absolute(),
     )
 
-    # Trim the fits image to remove empty pixels
+    # Trim the fits image to remove empty pixels. The weight map reuses the
+    # bounding box computed from the image, so its rewrite is pushed onto a
+    # worker thread and overlaps the remaining cleanup work below.
+    weight_trim_future = None
     if linmos_options.trim_linmos_fits:
+        trim_executor = ThreadPoolExecutor(max_workers=1)
         image_trim_results = trim_fits_image(image_path=linmos_names.image_fits)
-        trim_fits_image(
+        weight_trim_future = trim_executor.submit(
+            trim_fits_image,
             image_path=linmos_names.weight_fits,
             bounding_box=image_trim_results.bounding_box,
         )
@@ -702,6 +874,10 @@ def linmos_images(
     if linmos_options.remove_original_images:
         remove_files_folders(*images)
 
+    if weight_trim_future is not None:
+        weight_trim_future.result()
+        trim_executor.shutdown()
+
     return linmos_result
 
 
@@ -134,6 +134,7 @@ def convolve_cubes(
     cutoff: float | None = None,
     convol_suffix: str = "conv",
     executor_type: Literal["thread", "process", "mpi"] = "thread",
+    ncores: int | None = None,
 ) -> Collection[Path]:
     logger.info(f"Will attempt to convol {len(cube_paths)} cubes")
     if cutoff:
@@ -159,6 +160,7 @@ def convolve_cubes(
         bpa=beam_pa_list,
         suffix=convol_suffix,
         executor_type=executor_type,
+        ncores=ncores,
     )
 
     # Construct the name of the new file created. For the moment this is done
@@ -180,6 +182,39 @@ def convolve_cubes(
     return convol_cubes_path
 
 
+_COMMON_BEAM_CACHE: dict[tuple, BeamShape] = {}
+"""Memoised common beam results keyed on image fingerprints and the cutoff"""
+
+
+def _common_beam_cache_key(
+    image_paths: Collection[Path], cutoff: float | None
+) -> tuple | None:
+    """Construct a cache key for a common beam computation from a cheap
+    fingerprint of the input images. Should any image not be stat-able
+    None is returned and no caching should be performed.
+
+    Args:
+        image_paths (Collection[Path]): The paths that would be examined
+        cutoff (float | None): The maximum beam size considered
+
+    Returns:
+        tuple | None: A hashable key, or None if one could not be formed
+    """
+    try:
+        fingerprints = tuple(
+            sorted(
+                (str(image_path), stat.st_mtime_ns, stat.st_size)
+                for image_path, stat in (
+                    (image_path, Path(image_path).stat()) for image_path in image_paths
+                )
+            )
+        )
+    except OSError:
+        return None
+
+    return (fingerprints, cutoff)
+
+
 def get_common_beam(
     image_paths: Collection[Path], cutoff: float | None = None
 ) -> BeamShape:
@@ -187,6 +222,10 @@ def get_common_beam(
     in the FITS header (e.g. BMAJ,BMIN,BPA) of the input images. This is used
     when preparing to convolve to a common resolution.
 
+    Results are memoised against a fingerprint of the input images (path,
+    modification time and size) so repeated calls over the same set (e.g.
+    the optimal and fixed beam passes of a field) skip the header reads.
+
     Args:
         image_paths (Collection[Path]): The paths to the FITS images that will be examined.
         cutoff (Optional[float], optional): The maximum beam size an input image is allowed to have. BMAJ's larger than this are ignored from the calculation. Defaults to None.
@@ -194,6 +233,11 @@ def get_common_beam(
     Returns:
         BeamShape: Smalled common beam available to be used
     """
+    cache_key = _common_beam_cache_key(image_paths=image_paths, cutoff=cutoff)
+    if cache_key is not None and cache_key in _COMMON_BEAM_CACHE:
+        beam_shape = _COMMON_BEAM_CACHE[cache_key]
+        logger.info(f"Reusing cached {beam_shape=}")
+        return beam_shape
 
     logger.info(f"Calculating common beam size of {len(image_paths)} images. ")
 
@@ -209,6 +253,9 @@ def get_common_beam(
         logger.info("The beam was not constrained. Setting to NaNs")
         beam_shape = BeamShape(bmaj_arcsec=np.nan, bmin_arcsec=np.nan, bpa_deg=np.nan)
 
+    if cache_key is not None:
+        _COMMON_BEAM_CACHE[cache_key] = beam_shape
+
     return beam_shape
 
 
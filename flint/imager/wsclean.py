@@ -43,6 +43,7 @@ from flint.logging import logger
 from flint.naming import (
     create_image_cube_name,
     create_imaging_name_prefix,
+    get_fits_cube_from_paths,
     split_images,
 )
 from flint.options import (
@@ -76,6 +77,19 @@ class ImageSet(BaseOptions):
     source_list: Path | None = None
     """Path to a source list that accompanies the image data"""
 
+    # NOTE: These are deliberately plain properties. A cached_property would
+    # store its result in the model __dict__, which with_options would then
+    # feed back into the constructor and trip extra="forbid"
+    @property
+    def mfs_images(self) -> tuple[Path, ...]:
+        """The MFS images among ``image``"""
+        return tuple(image for image in self.image if ".MFS." in str(image))
+
+    @property
+    def cube_images(self) -> tuple[Path, ...]:
+        """The cube images among ``image``"""
+        return tuple(get_fits_cube_from_paths(paths=list(self.image)))
+
 
 class WSCleanOptions(BaseOptions):
     """A basic container to handle WSClean options. These attributes should
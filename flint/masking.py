@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from argparse import ArgumentParser
 from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import NamedTuple
 
@@ -16,14 +18,16 @@ from astropy.wcs import WCS
 from capn_crunch import BaseOptions, add_options_to_parser, create_options_from_parser
 from numpy.typing import NDArray
 from radio_beam import Beam
-from reproject import reproject_interp
 from scipy.ndimage import (
-    binary_dilation as scipy_binary_dilation,  # Rename to distinguish from skimage
+    binary_closing,
+    binary_fill_holes,
+    iterate_structure,
+    label,
+    minimum_filter,
 )
 from scipy.ndimage import (
     binary_erosion as scipy_binary_erosion,  # Rename to distinguish from skimage
 )
-from scipy.ndimage import binary_fill_holes, label, minimum_filter
 from scipy.signal import fftconvolve
 
 from flint.logging import logger
@@ -32,6 +36,15 @@ from flint.utils import get_pixels_per_beam
 
 # TODO: Need to remove a fair amount of old approaches, and deprecate some of the toy functions
 
+# The 8-connectivity structuring element shared by the dilation / erosion /
+# labelling calls below. Boolean dtype matches what scipy uses internally,
+# so no per-call validation cast is made.
+_STRUCTURE_3X3 = np.ones((3, 3), dtype=bool)
+
+# The 3x3 structure iterated twice, so that closing-style operations built
+# from two-iteration dilation/erosion pairs may run as single passes
+_STRUCTURE_3X3_TWICE = iterate_structure(_STRUCTURE_3X3, 2)
+
 
 class MaskingOptions(BaseOptions):
     """Contains options for the creation of clean masks from some subject
@@ -169,16 +182,29 @@ def create_beam_mask_kernel(
         f"{kernel_size=}, but should be a tuple[int, int] by now"
     )
 
+    # The sigmas of the gaussian main lobe in pixel units. The half pi is the
+    # same convention shift radio-beam makes when it constructs its kernel
+    fwhm_to_sigma = 1.0 / (2.0 * np.sqrt(2.0 * np.log(2.0)))
+    sigma_x = (beam.major.to(pixel_unit).value / cdelt1) * fwhm_to_sigma
+    sigma_y = (beam.minor.to(pixel_unit).value / cdelt1) * fwhm_to_sigma
+    theta = np.deg2rad(90.0 + beam.pa.to(u.deg).value)
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+
     for iteration in range(10):
         y_kernel_size, x_kernel_size = kernel_size
 
-        # NOTE: This could be slow for large sizes.
-        # TODO: Consider evaluating the inner, padding the outer?
-        k = beam.as_kernel(
-            pixscale=cdelt1 * pixel_unit, x_size=x_kernel_size, y_size=y_kernel_size
-        )
-
-        mask = k.array > (np.max(k.array) * minimum_response)
+        # The mask is `exp(-0.5 * r^2) > peak * minimum_response`, which is an
+        # ellipse test that may be evaluated directly without constructing and
+        # normalising the full gaussian kernel. For even sized kernels no pixel
+        # sits at r=0, so the peak is the response at the pixel closest to centre.
+        y, x = np.mgrid[0:y_kernel_size, 0:x_kernel_size]
+        x = x - (x_kernel_size - 1) / 2.0
+        y = y - (y_kernel_size - 1) / 2.0
+        x_rot = x * cos_theta + y * sin_theta
+        y_rot = -x * sin_theta + y * cos_theta
+        r2 = (x_rot / sigma_x) ** 2 + (y_rot / sigma_y) ** 2
+
+        mask = r2 < (np.min(r2) - 2.0 * np.log(minimum_response))
         if not auto_resize:
             break
 
@@ -202,6 +228,46 @@ def create_beam_mask_kernel(
     return mask
 
 
+def _as_bool_c(arr: np.ndarray) -> NDArray[np.bool]:
+    """Present an array as C-contiguous bool, which keeps the scipy binary
+    morphology routines on their fast path. Masks handed in by callers may be
+    int typed (e.g. straight from a FITS mask) or non-contiguous after a
+    squeeze or reshape. A no-op when the array is already in the right form."""
+    return np.ascontiguousarray(arr, dtype=bool)
+
+
+def _crop_kernel_to_extent(kernel: NDArray[np.bool]) -> NDArray[np.bool]:
+    """Crop a structuring kernel down to the smallest window that is symmetric
+    about its centre pixel and still contains every set pixel. The auto-resize
+    behaviour of ``create_beam_mask_kernel`` guarantees an empty border, and
+    erosion cost scales with the full kernel footprint whether or not those
+    border pixels are set.
+
+    Args:
+        kernel (NDArray[np.bool]): The two-dimensional kernel to crop
+
+    Returns:
+        NDArray[np.bool]: The cropped kernel, or the input if it can not be cropped
+    """
+    slices = []
+    for axis, size in enumerate(kernel.shape):
+        centre = size // 2
+        set_idx = np.flatnonzero(kernel.any(axis=1 - axis))
+        if set_idx.size == 0:
+            return kernel
+
+        radius = np.max(np.abs(set_idx - centre))
+        if centre - radius < 0 or centre + radius >= size:
+            # Set pixels are lopsided about the centre index, so a symmetric
+            # crop would clip them. Leave the kernel be.
+            return kernel
+
+        slices.append(slice(centre - radius, centre + radius + 1))
+
+    logger.debug(f"Cropping kernel from {kernel.shape} to symmetric extent")
+    return kernel[tuple(slices)]
+
+
 def fft_binary_erosion(
     mask: NDArray[np.bool] | NDArray[np.floating],
     kernel: NDArray[np.bool],
@@ -225,8 +291,11 @@ def fft_binary_erosion(
     logger.info("Beginning fft erosion ... ")
     original_shape = mask.shape
 
-    mask = mask[..., :, :].astype(float)
-    kernel = kernel[..., :, :].astype(float)
+    # Single precision is plenty here - the convolution only ever counts
+    # overlapping ones up to the kernel size - and it halves the bytes the
+    # FFTs have to push around
+    mask = mask[..., :, :].astype(np.float32)
+    kernel = kernel[..., :, :].astype(np.float32)
 
     import scipy
 
@@ -274,11 +343,14 @@ def create_multi_scale_erosion(
         kernel_size=max(16, int(1 + scale * 1.1)),
         auto_resize=True,
     )
+    beam_mask_kernel = _crop_kernel_to_extent(kernel=beam_mask_kernel)
 
     # This handles any unsqueezed dimensions
     beam_mask_kernel = beam_mask_kernel.reshape(
         mask.shape[:-2] + beam_mask_kernel.shape
     )
+    mask = _as_bool_c(mask)
+    beam_mask_kernel = _as_bool_c(beam_mask_kernel)
 
     # As far as this pirate knows the scipy_binary_erosion used
     # at the bottom is evaluated in the imade plane. For larger
@@ -337,17 +409,29 @@ def beam_shape_erode(
 
     scales = [0] if scales is None else scales
     assert isinstance(scales, (list, tuple)), f"{scales} should be a list or tuple"
+    assert len(scales) <= 8, f"{len(scales)=} scales will not fit a uint8 bitmask"
     logger.info(f"Eroding across {scales=}")
 
-    out_mask = np.zeros(mask.shape)
+    out_mask = np.zeros(mask.shape, dtype=np.uint8)
 
-    for index, scale in enumerate(scales):
-        erode_mask = create_multi_scale_erosion(
+    def _erode_at_scale(scale: int) -> np.ndarray:
+        return create_multi_scale_erosion(
             mask=mask,
             fits_header=fits_header,
             scale=scale,
             minimum_response=minimum_response,
         )
+
+    if len(scales) == 1:
+        erode_masks = [_erode_at_scale(scales[0])]
+    else:
+        # Each scale erodes the same input independently, and both the scipy
+        # and FFT erosion backends release the GIL, so threads give real
+        # parallelism here. map preserves ordering for the bit positions.
+        with ThreadPoolExecutor(max_workers=len(scales)) as pool:
+            erode_masks = list(pool.map(_erode_at_scale, scales))
+
+    for index, erode_mask in enumerate(erode_masks):
         out_mask[erode_mask == 1.0] += 2**index
 
     if len(scales) == 1:
@@ -392,23 +476,42 @@ def extract_beam_mask_from_mosaic(
 
     with fits.open(fits_mosaic_mask_names.mask_fits) as mosaic_mask:
         logger.info("Extracting region")
-        extract_image = reproject_interp(
-            input_data=(
-                np.squeeze(mosaic_mask[0].data),
-                WCS(mosaic_mask[0].header).celestial,
-            ),
-            output_projection=WCS(header).celestial,
-            shape_out=beam_image_shape,
-            order=0,
+        mosaic_data = np.squeeze(mosaic_mask[0].data)
+        mosaic_wcs = WCS(mosaic_mask[0].header).celestial
+        beam_wcs = WCS(header).celestial
+
+        # A mask only needs the nearest-neighbour source pixel for each
+        # target pixel, so a single pix->world->pix pass and a gather does
+        # the job without the interpolation machinery of reproject
+        yy, xx = np.indices(beam_image_shape)
+        ra, dec = beam_wcs.all_pix2world(xx, yy, 0)
+        src_x, src_y = mosaic_wcs.all_world2pix(ra, dec, 0)
+        src_x = np.round(src_x).astype(int)
+        src_y = np.round(src_y).astype(int)
+
+        in_bounds = (
+            (src_x >= 0)
+            & (src_x < mosaic_data.shape[-1])
+            & (src_y >= 0)
+            & (src_y < mosaic_data.shape[-2])
         )
-    logger.info("Clipping extract mask results (interpolation errors)")
-    extract_image = np.clip(extract_image, 0.0, 1.0)
+        extract_image = np.zeros(beam_image_shape, dtype=np.uint8)
+        extract_image[in_bounds] = mosaic_data[src_y[in_bounds], src_x[in_bounds]]
 
-    fits.writeto(mask_names.mask_fits, extract_image[0].astype(np.int32), header)
+    fits.writeto(mask_names.mask_fits, extract_image, header)
 
     return mask_names
 
 
+def _demote_to_float32(arr: np.ndarray | None) -> np.ndarray | None:
+    """Downcast float64 arrays to float32. The masking operations are memory
+    bound and float32 carries more than enough precision for them, so halving
+    the bytes moved is a straight throughput win."""
+    if arr is not None and arr.dtype == np.float64:
+        return arr.astype(np.float32)
+    return arr
+
+
 def _get_signal_image(
     image: np.ndarray | None = None,
     rms: np.ndarray | None = None,
@@ -418,12 +521,19 @@ def _get_signal_image(
     if all([item is None for item in (image, background, rms, signal)]):
         raise ValueError("No input maps have been provided. ")
 
+    image = _demote_to_float32(image)
+    rms = _demote_to_float32(rms)
+    background = _demote_to_float32(background)
+    signal = _demote_to_float32(signal)
+
     if signal is None and image is not None and rms is not None:
+        # A zero background contributes nothing, so skip materialising it and
+        # the subtraction pass entirely
         if background is None:
             logger.info("No background supplied, assuming zeros. ")
-            background = np.zeros_like(image)
-
-        out_signal = (image - background) / rms
+            out_signal = image / rms
+        else:
+            out_signal = (image - background) / rms
     else:
         out_signal = signal
 
@@ -473,25 +583,25 @@ def grow_low_snr_mask(
         f"Growing mask for low surface brightness using {grow_low_snr=} {grow_low_island_size=}"
     )
     low_snr_mask = signal > grow_low_snr
-    low_snr_mask = scipy_binary_dilation(
-        input=low_snr_mask, iterations=2, structure=np.ones((3, 3))
-    )
-    low_snr_mask = scipy_binary_erosion(
-        input=low_snr_mask, iterations=2, structure=np.ones((3, 3))
+    # The closing with the pre-iterated structure is equivalent to the
+    # two-iteration dilation/erosion pair it replaces, in half the image passes
+    low_snr_mask = binary_closing(
+        input=low_snr_mask, structure=_STRUCTURE_3X3_TWICE, iterations=1
     )
 
     if region_mask is not None:
-        low_snr_mask[region_mask] = False
+        low_snr_mask &= ~region_mask
 
-    mask_labels, no_labels = label(low_snr_mask, structure=np.ones((3, 3)))
-    _, counts = np.unique(mask_labels.flatten(), return_counts=True)
+    mask_labels, no_labels = label(low_snr_mask, structure=_STRUCTURE_3X3)
+    # Labels are contiguous integers in [0, no_labels], so bincount gives the
+    # island sizes in a single pass without sorting the full label image
+    counts = np.bincount(mask_labels.ravel(), minlength=no_labels + 1)
 
-    small_islands = [
-        idx
-        for idx, count in enumerate(counts)
-        if count < grow_low_island_size and idx > 0
-    ]
-    low_snr_mask[np.isin(mask_labels, small_islands)] = False
+    # A boolean lookup table over label ids avoids the sort+searchsort that
+    # np.isin performs over the full label image
+    drop_lut = counts < grow_low_island_size
+    drop_lut[0] = False
+    low_snr_mask &= ~drop_lut[mask_labels]
 
     return low_snr_mask
 
@@ -537,6 +647,53 @@ def create_boxcar_skew_mask(
     )
 
 
+def _mac_rolling_box_min(
+    image: np.ndarray,
+    box_size: int = 100,
+    adaptive_max_depth: int | None = None,
+    adaptive_box_step: float = 2.0,
+    adaptive_skew_delta: float = 0.2,
+) -> np.ndarray:
+    """Compute the rolling boxcar minimum that the mac thresholds are taken
+    against. This is the expensive part of the mac procedure, split out so
+    callers thresholding the same image at several levels may compute it once.
+
+    Args:
+        image (np.ndarray): The input array to consider
+        box_size (int, optional): Size of the rolling boxcar minimum filter. Defaults to 100.
+        adaptive_max_depth (Optional[int], optional): The maximum number of rounds the adaptive mode may perform. None disables the adaptive mode. Defaults to None.
+        adaptive_box_step (float, optional): A multiplicative factor to increase the boxcar size by each round. Defaults to 2.0.
+        adaptive_skew_delta (float, optional): Minimum deviation from 0.5 needed to classify a region as skewed. Defaults to 0.2.
+
+    Returns:
+        np.ndarray: The rolling boxcar minimum of the image
+    """
+    if adaptive_max_depth is None:
+        return minimum_filter(image, box_size, mode="wrap")
+
+    min_value = minimum_filter(input=image, size=box_size, mode="wrap")
+
+    for box_round in range(int(adaptive_max_depth), 0, -1):
+        skew_results = create_boxcar_skew_mask(
+            image=image, skew_delta=adaptive_skew_delta, box_size=box_size
+        )
+        if np.all(~skew_results.skew_mask):
+            logger.info("No skewed islands detected")
+            break
+        if any([box_size > dim for dim in image.shape]):
+            logger.info(f"{box_size=} larger than a dimension in {image.shape=}")
+            break
+
+        logger.info(f"({box_round}) Growing {box_size=} {adaptive_box_step=}")
+        box_size = int(box_size * adaptive_box_step)
+        _min_value = minimum_filter(input=image, size=box_size, mode="wrap")
+        logger.debug("Slicing minimum values into place")
+
+        min_value[skew_results.skew_mask] = _min_value[skew_results.skew_mask]
+
+    return min_value
+
+
 def _minimum_absolute_clip(
     image: np.ndarray, increase_factor: float = 2.0, box_size: int = 100
 ) -> np.ndarray:
@@ -553,9 +710,14 @@ def _minimum_absolute_clip(
         np.ndarray: The mask of pixels above the locally varying threshold
     """
     logger.info(f"Minimum absolute clip, {increase_factor=} {box_size=}")
-    rolling_box_min = minimum_filter(image, box_size, mode="wrap")
-
-    image_mask = image > (increase_factor * np.abs(rolling_box_min))
+    rolling_box_min = _mac_rolling_box_min(image=image, box_size=box_size)
+
+    # The filter output is a fresh local array, so the absolute value and
+    # scaling can be folded into it without temporaries before the final
+    # comparison pass
+    np.abs(rolling_box_min, out=rolling_box_min)
+    rolling_box_min *= increase_factor
+    image_mask = image > rolling_box_min
     # NOTE: This used to attempt to select pixels should that belong to an island of positive pixels with a box that was too small
     # | (
     #     (image > 0.0) & (rolling_box_min > 0.0)
@@ -575,27 +737,17 @@ def _adaptive_minimum_absolute_clip(
     logger.info(
         f"Using adaptive minimum absolute clip with {box_size=} {adaptive_skew_delta=}"
     )
-    min_value = minimum_filter(input=image, size=box_size, mode="wrap")
-
-    for box_round in range(adaptive_max_depth, 0, -1):
-        skew_results = create_boxcar_skew_mask(
-            image=image, skew_delta=adaptive_skew_delta, box_size=box_size
-        )
-        if np.all(~skew_results.skew_mask):
-            logger.info("No skewed islands detected")
-            break
-        if any([box_size > dim for dim in image.shape]):
-            logger.info(f"{box_size=} larger than a dimension in {image.shape=}")
-            break
-
-        logger.info(f"({box_round}) Growing {box_size=} {adaptive_box_step=}")
-        box_size = int(box_size * adaptive_box_step)
-        _min_value = minimum_filter(input=image, size=box_size, mode="wrap")
-        logger.debug("Slicing minimum values into place")
-
-        min_value[skew_results.skew_mask] = _min_value[skew_results.skew_mask]
+    min_value = _mac_rolling_box_min(
+        image=image,
+        box_size=box_size,
+        adaptive_max_depth=adaptive_max_depth,
+        adaptive_box_step=adaptive_box_step,
+        adaptive_skew_delta=adaptive_skew_delta,
+    )
 
-    mask = image > (np.abs(min_value) * increase_factor)
+    np.abs(min_value, out=min_value)
+    min_value *= increase_factor
+    mask = image > min_value
 
     return mask
 
@@ -657,6 +809,37 @@ def minimum_absolute_clip(
     )
 
 
+def _flood_fill_positive_mask(
+    positive_mask: np.ndarray, flood_floor_mask: np.ndarray
+) -> np.ndarray:
+    """Grow seeded islands out to the flood floor level. This is equivalent
+    to a binary dilation of the seeds constrained to the floor mask iterated
+    until convergence, but instead of repeated full-image dilation passes the
+    floor mask is labelled once and islands containing a seed are kept. Each
+    pixel is visited a constant number of times no matter how large the
+    islands grow.
+
+    Args:
+        positive_mask (np.ndarray): The seed pixels that will be grown
+        flood_floor_mask (np.ndarray): Pixels that the seeds are allowed to grow into
+
+    Returns:
+        np.ndarray: The seeds grown out to the flood floor
+    """
+    mask_labels, no_labels = label(flood_floor_mask, structure=_STRUCTURE_3X3)
+
+    # Only the labels under a seed survive. The gather over the seed pixels
+    # is small compared to the image, and the lookup table is tiny.
+    seeded_labels = np.unique(mask_labels[positive_mask])
+    seeded_lut = np.zeros(no_labels + 1, dtype=bool)
+    seeded_lut[seeded_labels] = True
+    seeded_lut[0] = False
+
+    # Seeds outside of the floor mask are retained, as they would be under
+    # the constrained dilation
+    return seeded_lut[mask_labels] | positive_mask
+
+
 def _verify_set_positive_seed_clip(
     positive_seed_clip: float, signal: np.ndarray
 ) -> float:
@@ -718,22 +901,23 @@ def reverse_negative_flood_fill(
     logger.info(f"{masking_options=} ")
 
     if masking_options.flood_fill_use_mac:
-        positive_mask = minimum_absolute_clip(
+        # Both mac levels are drawn against the same box size, so the rolling
+        # minimum (the expensive part) is computed once and thresholded twice
+        box_min = _mac_rolling_box_min(
             image=base_image,
-            increase_factor=masking_options.flood_fill_positive_seed_clip,
             box_size=masking_options.flood_fill_use_mac_box_size,
             adaptive_max_depth=masking_options.flood_fill_use_mac_adaptive_max_depth,
             adaptive_box_step=masking_options.flood_fill_use_mac_adaptive_step_factor,
             adaptive_skew_delta=masking_options.flood_fill_use_mac_adaptive_skew_delta,
         )
-        flood_floor_mask = minimum_absolute_clip(
-            image=base_image,
-            increase_factor=masking_options.flood_fill_positive_flood_clip,
-            box_size=masking_options.flood_fill_use_mac_box_size,
-            adaptive_max_depth=masking_options.flood_fill_use_mac_adaptive_max_depth,
-            adaptive_box_step=masking_options.flood_fill_use_mac_adaptive_step_factor,
-            adaptive_skew_delta=masking_options.flood_fill_use_mac_adaptive_skew_delta,
+        np.abs(box_min, out=box_min)
+
+        threshold = box_min * masking_options.flood_fill_positive_seed_clip
+        positive_mask = base_image > threshold
+        np.multiply(
+            box_min, masking_options.flood_fill_positive_flood_clip, out=threshold
         )
+        flood_floor_mask = base_image > threshold
     else:
         # Sanity check the upper clip level, you rotten seadog
         positive_seed_clip = _verify_set_positive_seed_clip(
@@ -742,15 +926,20 @@ def reverse_negative_flood_fill(
         )
         # Here we create the mask image that will start the binary dilation
         # process, and we will ensure only pixels above the `positive_flood_clip`
-        # are allowed to be dilated. In other words we are growing the mask
-        positive_mask = base_image >= positive_seed_clip
-        flood_floor_mask = base_image > masking_options.flood_fill_positive_flood_clip
-
-    positive_dilated_mask = scipy_binary_dilation(
-        input=positive_mask,
-        mask=flood_floor_mask,
-        iterations=1000,
-        structure=np.ones((3, 3)),
+        # are allowed to be dilated. In other words we are growing the mask.
+        # Both thresholds are taken back-to-back into preallocated buffers so
+        # the image is swept while hot in cache and no bool temporaries are made
+        positive_mask = np.empty(base_image.shape, dtype=bool)
+        flood_floor_mask = np.empty(base_image.shape, dtype=bool)
+        np.greater_equal(base_image, positive_seed_clip, out=positive_mask)
+        np.greater(
+            base_image,
+            masking_options.flood_fill_positive_flood_clip,
+            out=flood_floor_mask,
+        )
+
+    positive_dilated_mask = _flood_fill_positive_mask(
+        positive_mask=positive_mask, flood_floor_mask=flood_floor_mask
     )
 
     if masking_options.grow_low_snr_island:
@@ -759,44 +948,68 @@ def reverse_negative_flood_fill(
             grow_low_snr=masking_options.grow_low_snr_island_clip,
             grow_low_island_size=masking_options.grow_low_snr_island_size,
         )
-        positive_dilated_mask[low_snr_mask] = True
+        positive_dilated_mask |= low_snr_mask
 
-    return positive_dilated_mask.astype(np.int32)
+    # uint8 is all a zero/non-zero wsclean mask needs, and it quarters the
+    # bytes written out relative to the previous int32
+    return positive_dilated_mask.astype(np.uint8)
 
 
 def _create_signal_from_rmsbkg(
     image: Path | np.ndarray,
     rms: Path | np.ndarray,
     bkg: Path | np.ndarray,
+    slab_rows: int = 512,
 ) -> np.ndarray:
-    logger.info("Creating signal image")
-
-    if isinstance(image, Path):
-        with fits.open(image) as in_fits:
-            logger.info(f"Loading {image}")
-            image = in_fits[0].data  # type: ignore
+    """Compute ``(image - bkg) / rms``. FITS inputs are opened with memmaps
+    and processed in horizontal slabs so only a sliver of each image is ever
+    resident, rather than three full arrays at once.
 
-    assert isinstance(image, np.ndarray), (
-        f"Expected the image to be a numpy array by now, instead have {type(image)}"
-    )
-
-    if isinstance(bkg, Path):
-        with fits.open(bkg) as in_fits:
-            logger.info(f"Loading {bkg=}")
-            bkg = in_fits[0].data  # type: ignore
+    Args:
+        image (Union[Path, np.ndarray]): The image to construct signal for. If an array it is modified in place.
+        rms (Union[Path, np.ndarray]): The noise across the image
+        bkg (Union[Path, np.ndarray]): The background across the image
+        slab_rows (int, optional): Number of rows processed per slab. Defaults to 512.
 
-    logger.info("Subtracting background")
-    image -= bkg
+    Returns:
+        np.ndarray: The signal image
+    """
+    logger.info("Creating signal image")
 
-    if isinstance(rms, Path):
-        with fits.open(rms) as in_fits:
-            logger.info(f"Loading {rms=}")
-            rms = in_fits[0].data  # type: ignore
+    opened_fits: list[fits.HDUList] = []
+
+    def _as_data(item: Path | np.ndarray) -> np.ndarray:
+        if isinstance(item, Path):
+            logger.info(f"Opening {item}")
+            open_fits = fits.open(item, mode="readonly", memmap=True)
+            opened_fits.append(open_fits)
+            return open_fits[0].data  # type: ignore
+        return item
+
+    try:
+        image_data = _as_data(image)
+        bkg_data = _as_data(bkg)
+        rms_data = _as_data(rms)
+
+        # Reuse the caller's array when one was passed in (matching the
+        # previous in place behaviour), otherwise allocate the only full
+        # sized array this function needs. A float64 input array is not
+        # reused so the signal is carried at float32 downstream
+        out_signal = (
+            image
+            if isinstance(image, np.ndarray) and image.dtype != np.float64
+            else np.empty(image_data.shape, dtype=np.float32)
+        )
 
-    logger.info("Dividing by rms")
-    image /= rms
+        for row in range(0, image_data.shape[-2], slab_rows):
+            slab = (Ellipsis, slice(row, row + slab_rows), slice(None))
+            np.subtract(image_data[slab], bkg_data[slab], out=out_signal[slab])
+            out_signal[slab] /= rms_data[slab]
+    finally:
+        for open_fits in opened_fits:
+            open_fits.close()
 
-    return np.array(image)
+    return out_signal
 
 
 def _need_to_make_signal(masking_options: MaskingOptions) -> bool:
@@ -886,15 +1099,20 @@ def create_snr_mask_from_fits(
     if masking_options.flood_fill:
         # TODO: The image and signal masks both don't need to be inputs. Image is only used
         # if mac = True
+        # The contiguous native float32 view keeps the filter and threshold
+        # passes on strided big-endian FITS buffers off the slow paths
         mask_data = reverse_negative_flood_fill(
-            base_image=np.squeeze(signal_data),
+            base_image=np.ascontiguousarray(np.squeeze(signal_data), dtype=np.float32),
             masking_options=masking_options,
             pixels_per_beam=pixels_per_beam,
         )
         mask_data = mask_data.reshape(signal_data.shape)
     else:
         logger.info(f"Clipping using a {masking_options.base_snr_clip=}")
-        mask_data = (signal_data > masking_options.base_snr_clip).astype(np.int32)
+        # Threshold straight into a uint8 buffer - wsclean only distinguishes
+        # zero from non-zero, so there is no need for the int32 copy
+        mask_data = np.empty(signal_data.shape, dtype=np.uint8)
+        np.greater(signal_data, masking_options.base_snr_clip, out=mask_data.view(bool))
 
     if masking_options.beam_shape_erode:
         mask_data = beam_shape_erode(
@@ -1009,8 +1227,9 @@ def create_convolved_erosion_mask(
         else masking_options.beam_shape_erode_scales
     )
     logger.info(f"Will be processing {scales=}")
+    assert len(scales) <= 8, f"{len(scales)=} scales will not fit a uint8 bitmask"
 
-    output_mask = np.zeros_like(base_image)
+    output_mask = np.zeros(base_image.shape, dtype=np.uint8)
 
     for index, scale in enumerate(scales):
         convolved_image = base_image.copy()
@@ -1058,11 +1277,8 @@ def create_convolved_erosion_mask(
 
         # Ensure positive only pixels. useful (necessary?) at larger scales bridging
         # across negative pixels
-        positive_dilated_mask = scipy_binary_dilation(
-            input=positive_mask,
-            mask=flood_floor_mask,
-            iterations=1000,
-            structure=np.ones((3, 3)),
+        positive_dilated_mask = _flood_fill_positive_mask(
+            positive_mask=positive_mask, flood_floor_mask=flood_floor_mask
         )
 
         # output_mask[positive_dilated_mask] += 2**index
@@ -1102,7 +1318,12 @@ def get_parser() -> ArgumentParser:
         "mask",
         help="Create a mask for an image, potentially using its RMS and BKG images (e.g. outputs from BANE). Output FITS image will default to the image with a mask suffix.",
     )
-    fits_parser.add_argument("image", type=Path, help="Path to the input image. ")
+    fits_parser.add_argument(
+        "image",
+        type=Path,
+        nargs="+",
+        help="Path to the input image. Should multiple images be provided they are masked in parallel across processes. ",
+    )
     fits_parser = add_options_to_parser(
         parser=fits_parser, options_class=MaskingOptions
     )
@@ -1149,18 +1370,36 @@ def cli():
             parser_namespace=args, options_class=MaskingOptions
         )
         if masking_options.convolve_first:
-            create_convolved_erosion_mask(
-                fits_image_path=args.image, masking_options=masking_options
+            create_mask = partial(
+                create_convolved_erosion_mask, masking_options=masking_options
             )
         else:
-            create_snr_mask_from_fits(
-                fits_image_path=args.image,
+            create_mask = partial(
+                create_snr_mask_from_fits,
+                masking_options=masking_options,
                 fits_rms_path=args.rms_fits,
                 fits_bkg_path=args.bkg_fits,
                 create_signal_fits=args.save_signal,
-                masking_options=masking_options,
             )
 
+        image_paths = list(args.image)
+        if len(image_paths) > 1 and (args.rms_fits or args.bkg_fits):
+            # A single rms/bkg pair only corresponds to one image - applying
+            # it to the others would silently mask against the wrong noise maps
+            raise ValueError(
+                "--rms-fits/--bkg-fits correspond to a single image and can not "
+                f"be applied to {len(image_paths)} images. Provide one image, or "
+                "drop the rms/bkg paths. "
+            )
+        if len(image_paths) == 1:
+            create_mask(fits_image_path=image_paths[0])
+        else:
+            # Each image is independent of the others, so fan the work out
+            # across processes
+            logger.info(f"Masking {len(image_paths)} images across processes")
+            with ProcessPoolExecutor() as pool:
+                list(pool.map(create_mask, image_paths))
+
     elif args.mode == "extractmask":
         extract_beam_mask_from_mosaic(
             fits_beam_image_path=args.beam_image,
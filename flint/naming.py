@@ -4,8 +4,10 @@ products.
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, NamedTuple, TypeVar
 
@@ -14,6 +16,29 @@ from flint.logging import logger
 
 PathStr = TypeVar("PathStr", str, Path)
 
+# Patterns used to pull apart recognised file names. Compiled once at import
+# time as name parsing is called in inner loops over many MSs and images
+_SELFCAL_ROUND_RE = re.compile(r"\.round[0-9]+.ms")
+_CASDA_RE = re.compile(
+    r"^(?P<format>(scienceData|1934))(\.(?P<alias>.*))?\.SB(?P<sbid>[0-9]+)(\.(?P<field>.*))?\.beam(?P<beam>[0-9]+).*ms"
+)
+_RAW_RE = re.compile(
+    "^(?P<date>[0-9]{4}-[0-9]{1,2}-[0-9]{1,2})_(?P<time>[0-9]+)_(?P<beam>[0-9]+)(_(?P<spw>[0-9]+))*"
+)
+# TODO: Should the Beam and field items be relaxed and allowed to be optional?
+# TODOL At very least I think the beam should become options
+# A raw string is used to avoid bad unicode escaping
+_PROCESSED_RE = re.compile(
+    r"^SB(?P<sbid>[0-9]+)"
+    r"\.(?P<field>[^.]+)"
+    r"((\.beam(?P<beam>[0-9]+))?)"
+    r"((\.spw(?P<spw>[0-9]+))?)"
+    r"((\.round(?P<round>[0-9]+))?)"
+    r"((\.(?P<pol>(i|q|u|v|xx|yy|xy|yx)+))?)"
+    r"((\.ch(?P<chl>([0-9]+))-(?P<chh>([0-9]+)))?)"
+    r"((\.scan(?P<scanl>([0-9]+))-(?P<scanh>([0-9]+)))?)"
+)
+
 
 def _rename_linear_to_stokes(
     linear_name_str: str,
@@ -48,9 +73,11 @@ def get_fits_cube_from_paths(paths: list[Path]) -> list[Path]:
     Returns:
         List[Path]: Set of paths matching the search criteria
     """
-    cube_expression = re.compile(r"\.cube\..*fits$")
-
-    cube_files = [path for path in paths if bool(cube_expression.search(str(path)))]
+    # The C-implemented string tests are markedly cheaper than a regex
+    # search when sifting through large directory listings
+    cube_files = [
+        path for path in paths if path.name.endswith("fits") and ".cube." in path.name
+    ]
 
     return cube_files
 
@@ -385,11 +412,13 @@ def get_selfcal_ms_name(in_ms_path: Path, round: int = 1) -> Path:
     Returns:
         Path: Output measurement set path to use
     """
-    res = re.search("\\.round[0-9]+.ms", str(in_ms_path.name))
+    name_str = str(in_ms_path.name)
+    # Most inputs have no prior round marker, so the cheap substring test
+    # skips the regex on the common path
+    res = _SELFCAL_ROUND_RE.search(name_str) if ".round" in name_str else None
     if res:
         logger.info("Detected a previous round of self-calibration. ")
         span = res.span()
-        name_str = str(in_ms_path.name)
         name = f"{name_str[: span[0]]}.round{round}.ms"
     else:
         name = f"{in_ms_path.stem!s}.round{round}.ms"
@@ -416,14 +445,20 @@ def add_timestamp_to_path(
     Returns:
         Path: Updated path with a timestamp in the file name
     """
-    input_path = Path(input_path)
     timestamp = timestamp if timestamp else datetime.now()
-
     time_str = timestamp.strftime("%Y%m%d-%H%M%S")
-    new_name = f"{input_path.stem}-{time_str}{input_path.suffix}"
-    output_path = input_path.with_name(new_name)
 
-    return output_path
+    # Splice the timestamp in with plain string handling - the transient Path
+    # objects of the stem/suffix/with_name approach add up in inner loops
+    path_str = os.fspath(input_path)
+    slash_idx = path_str.rfind("/")
+    dot_idx = path_str.rfind(".")
+
+    # No suffix in the name component (also covers hidden-file style names)
+    if dot_idx <= slash_idx + 1:
+        return Path(f"{path_str}-{time_str}")
+
+    return Path(f"{path_str[:dot_idx]}-{time_str}{path_str[dot_idx:]}")
 
 
 class CASDANameComponents(NamedTuple):
@@ -444,6 +479,7 @@ class CASDANameComponents(NamedTuple):
     """What the format / type of the data the MS is. """
 
 
+@lru_cache(maxsize=8192)
 def casda_ms_format(in_name: str | Path) -> CASDANameComponents | None:
     """Break up a CASDA sty;e MS name (really the askap pipeline format) into its recognised parts.
     if a match fails a `None` is returned.
@@ -465,10 +501,7 @@ def casda_ms_format(in_name: str | Path) -> CASDANameComponents | None:
     # scienceData.RACS_1237+00.SB40470.RACS_1237+00.beam35_averaged_cal.leakage.ms
 
     logger.debug(f"Matching {in_name}")
-    regex = re.compile(
-        r"^(?P<format>(scienceData|1934))(\.(?P<alias>.*))?\.SB(?P<sbid>[0-9]+)(\.(?P<field>.*))?\.beam(?P<beam>[0-9]+).*ms"
-    )
-    results = regex.match(in_name)
+    results = _CASDA_RE.match(in_name)
 
     if results is None:
         logger.debug(f"No casda_ms_format results to {in_name} found")
@@ -494,6 +527,7 @@ class RawNameComponents(NamedTuple):
     """If multiple MS were written as the data were in a high-frequency resolution mode, which segment"""
 
 
+@lru_cache(maxsize=8192)
 def raw_ms_format(in_name: str) -> None | RawNameComponents:
     """The typical ASKAP measurement written to the ingest disks
     has the form:
@@ -515,10 +549,7 @@ def raw_ms_format(in_name: str) -> None | RawNameComponents:
     """
 
     logger.debug(f"Matching {in_name}")
-    regex = re.compile(
-        "^(?P<date>[0-9]{4}-[0-9]{1,2}-[0-9]{1,2})_(?P<time>[0-9]+)_(?P<beam>[0-9]+)(_(?P<spw>[0-9]+))*"
-    )
-    results = regex.match(in_name)
+    results = _RAW_RE.match(in_name)
 
     if results is None:
         logger.debug(f"No raw_ms_format results to {in_name} found")
@@ -555,6 +586,7 @@ class ProcessedNameComponents(NamedTuple):
     """The scane range encoded in a file name. Generally are zero-padded and are two fields of the form scan1234-1235, where the epper bound is exclusive. Defaults to None."""
 
 
+@lru_cache(maxsize=8192)
 def processed_ms_format(
     in_name: str | Path,
 ) -> ProcessedNameComponents | None:
@@ -571,20 +603,7 @@ def processed_ms_format(
     in_name = in_name.name if isinstance(in_name, Path) else in_name
 
     logger.debug(f"Matching {in_name}")
-    # TODO: Should the Beam and field items be relaxed and allowed to be optional?
-    # TODOL At very least I think the beam should become options
-    # A raw string is used to avoid bad unicode escaping
-    regex = re.compile(
-        r"^SB(?P<sbid>[0-9]+)"
-        r"\.(?P<field>[^.]+)"
-        r"((\.beam(?P<beam>[0-9]+))?)"
-        r"((\.spw(?P<spw>[0-9]+))?)"
-        r"((\.round(?P<round>[0-9]+))?)"
-        r"((\.(?P<pol>(i|q|u|v|xx|yy|xy|yx)+))?)"
-        r"((\.ch(?P<chl>([0-9]+))-(?P<chh>([0-9]+)))?)"
-        r"((\.scan(?P<scanl>([0-9]+))-(?P<scanh>([0-9]+)))?)"
-    )
-    results = regex.match(in_name)
+    results = _PROCESSED_RE.match(in_name)
 
     if results is None:
         logger.debug(f"No processed_ms_format results to {in_name} found")
@@ -658,6 +677,7 @@ def create_path_from_processed_name_components(
     return out_path
 
 
+@lru_cache(maxsize=8192)
 def extract_components_from_name(
     name: str | Path,
 ) -> RawNameComponents | ProcessedNameComponents | CASDANameComponents:
@@ -681,28 +701,24 @@ def extract_components_from_name(
         Union[RawNameComponents,ProcessedNameComponents,CASDANamedComponents]: The extracted name components within a name
     """
     name = str(Path(name).name)
-    results_raw = raw_ms_format(in_name=name)
-    results_formatted = processed_ms_format(in_name=name)
-    results_casda = casda_ms_format(in_name=name)
-
-    if all([res is None for res in (results_raw, results_formatted, results_casda)]):
-        raise ValueError(f"Unrecognised file name format for {name=}. ")
-
-    matched = [
-        res
-        for res in (results_raw, results_formatted, results_casda)
-        if res is not None
-    ]
 
-    if len(matched) > 1:
-        logger.info(
-            f"The {name=} was recognised as more than one format. Selecting the simplest.  "
-        )
-        logger.info(f"{results_raw=} {results_formatted=} ")
-
-    results = matched[0]
+    # The ordering encodes the simplest-wins precedence that used to be
+    # applied after running every matcher; returning on the first hit means
+    # the remaining (more elaborate) patterns are never evaluated. Each
+    # pattern is anchored, so a cheap prefix test decides whether its regex
+    # can possibly match before the engine is invoked at all
+    for may_match, matcher in (
+        (name[:1].isdigit(), raw_ms_format),
+        (name.startswith("SB"), processed_ms_format),
+        (name.startswith(("scienceData", "1934")), casda_ms_format),
+    ):
+        if not may_match:
+            continue
+        results = matcher(in_name=name)
+        if results is not None:
+            return results
 
-    return results
+    raise ValueError(f"Unrecognised file name format for {name=}. ")
 
 
 def split_images(
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import AltAz, EarthLocation, get_sun
+from astropy.time import Time
 from capn_crunch import add_options_to_parser, create_options_from_parser
+from casacore.tables import table
 from jolly_roger.tractor import TukeyTractorOptions, tukey_tractor
 
 from flint.logging import logger
@@ -14,6 +20,91 @@ from flint.options import (
     MS,
 )
 
+AUTO_CHUNK_TARGET_BYTES = 32 * 1024**2
+"""Target number of contiguous visibility bytes a single tractor chunk should cover"""
+
+
+def _auto_chunk_size(
+    ms_path: Path,
+    data_column: str = "DATA",
+    target_bytes: int = AUTO_CHUNK_TARGET_BYTES,
+) -> int:
+    """Derive a tractor chunk size (in rows) from the shape of the visibility
+    data, aiming for ``target_bytes`` of contiguous data per chunk. Larger
+    sequential reads mean fewer casacore table-iterator round trips on big
+    measurement sets.
+
+    Args:
+        ms_path (Path): The measurement set the tractor will stream over
+        data_column (str, optional): The visibility column that will be read. Defaults to "DATA".
+        target_bytes (int, optional): How many bytes each chunk should aim to cover. Defaults to AUTO_CHUNK_TARGET_BYTES.
+
+    Returns:
+        int: Number of rows per chunk
+    """
+    with table(str(ms_path), readonly=True, ack=False) as tab:
+        row_shape = tab.getcell(data_column, 0).shape
+
+    # Visibilities are complex64 on disk
+    bytes_per_row = int(np.prod(row_shape)) * 8
+    chunk_size = max(256, target_bytes // bytes_per_row)
+    logger.info(f"Derived {chunk_size=} rows from {row_shape=} in {data_column=}")
+
+    return int(chunk_size)
+
+
+@lru_cache(maxsize=4096)
+def _sun_elevation_deg(
+    time_sec: float, antenna_position: tuple[float, float, float]
+) -> float:
+    """Compute the elevation of the Sun at a single instant from a geocentric
+    array position. Cached, as MSs from the same scheduling block share an
+    array position and overlapping timestamps. Round ``time_sec`` to whole
+    seconds before calling to maximise cache hits.
+
+    Args:
+        time_sec (float): Observation time in seconds since the MJD epoch (the MS TIME convention)
+        antenna_position (tuple[float, float, float]): Geocentric (x, y, z) position of the array in metres
+
+    Returns:
+        float: The elevation of the Sun in degrees
+    """
+    location = EarthLocation.from_geocentric(*(np.array(antenna_position) * u.m))
+    obs_time = Time(time_sec / 86400.0, format="mjd", scale="utc")
+    sun_altaz = get_sun(obs_time).transform_to(
+        AltAz(obstime=obs_time, location=location)
+    )
+
+    return float(sun_altaz.alt.deg)
+
+
+def _maximum_sun_elevation(ms_path: Path) -> float:
+    """Evaluate the largest elevation the Sun reaches over the time range of
+    a measurement set, as seen from the observing array. Only the start,
+    middle and end of the observation are considered, which is plenty for the
+    slowly varying solar altitude. The time bounds are taken over the full
+    TIME column, as rows of a measurement set need not be time-ordered.
+
+    Args:
+        ms_path (Path): The measurement set to draw the time range and array position from
+
+    Returns:
+        float: The maximum elevation of the Sun in degrees
+    """
+    with table(str(ms_path), readonly=True, ack=False) as tab:
+        time_column = tab.getcol("TIME")
+    with table(f"{ms_path!s}/ANTENNA", readonly=True, ack=False) as tab:
+        antenna_position = tuple(tab.getcell("POSITION", 0))
+
+    time_start = float(np.min(time_column))
+    time_end = float(np.max(time_column))
+    times = (time_start, (time_start + time_end) / 2.0, time_end)
+
+    return max(
+        _sun_elevation_deg(time_sec=round(time_sec), antenna_position=antenna_position)
+        for time_sec in times
+    )
+
 
 def jolly_roger_tractor(
     ms: MS | Path,
@@ -22,6 +113,10 @@ def jolly_roger_tractor(
 ) -> MS:
     """Run the `jolly_roger` tukey tractor method to null towards an object.
 
+    Should the ``chunk_size`` of the options be 0 or negative an appropriate
+    value is derived from the visibility shape of the input measurement set
+    (see ``_auto_chunk_size``).
+
     Args:
         ms (MS | Path): The measurement set to modify
         tukey_tractor_options (TukeyTractorOptions | None, optional): Settings to modify the tukey tractor algorithm. If None defaults are used. Defaults to None.
@@ -35,22 +130,39 @@ def jolly_roger_tractor(
         logger.info("Using default tukey tractor options")
         tukey_tractor_options = TukeyTractorOptions()
 
-    assert isinstance(tukey_tractor_options, TukeyTractorOptions), (
-        "Tukey taper is not correct type, which should not happen"
-    )
-    if update_tukey_tractor_options is not None:
+    if update_tukey_tractor_options:
         logger.info("Updating tukey tractor options")
         tukey_tractor_options = tukey_tractor_options.with_options(
             **update_tukey_tractor_options
         )
 
+    if tukey_tractor_options.elevation_cut_deg > 0 and set(
+        tukey_tractor_options.target_objects
+    ) == {"sun"}:
+        max_elevation = _maximum_sun_elevation(ms_path=ms.path)
+        if max_elevation < tukey_tractor_options.elevation_cut_deg:
+            logger.info(
+                f"Sun stays below {tukey_tractor_options.elevation_cut_deg=} deg "
+                f"({max_elevation=:.2f}), skipping the tractor"
+            )
+            return ms
+
+    if tukey_tractor_options.chunk_size <= 0:
+        tukey_tractor_options = tukey_tractor_options.with_options(
+            chunk_size=_auto_chunk_size(
+                ms_path=ms.path, data_column=tukey_tractor_options.data_column
+            )
+        )
+
     logger.info("Running the jolly-roger's tukey tractor")
     tukey_tractor(ms_path=ms.path, tukey_tractor_options=tukey_tractor_options)
 
     return ms.with_options(column=tukey_tractor_options.output_column)
 
 
+@lru_cache(maxsize=1)
 def get_parser() -> ArgumentParser:
+    # Cached - building the parser introspects the options class each time
     parser = ArgumentParser(description="Concise entry point to run jolly-roger")
     parser.add_argument(
         "ms_path", type=Path, help="Path to the measurement set to be modified"
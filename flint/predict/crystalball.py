@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -96,7 +97,9 @@ def crystalball_predict(
     return ms.with_options(model_column="MODEL_DATA")
 
 
+@lru_cache(maxsize=1)
 def get_parser() -> ArgumentParser:
+    # Cached - building the parser introspects the options class each time
     parser = ArgumentParser(
         description="The crystal ball interface to add model visibilities from a wsclean file"
     )
@@ -6,7 +6,10 @@ imaging flows.
 
 from __future__ import annotations
 
-from collections.abc import Collection
+import logging
+from collections.abc import Callable, Collection
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, ParamSpec, TypeVar
 
@@ -57,7 +60,6 @@ from flint.ms import (
 from flint.naming import (
     FITSMaskNames,
     get_beam_resolution_str,
-    get_fits_cube_from_paths,
 )
 from flint.options import FieldOptions, SubtractFieldOptions
 from flint.peel.potato import potato_peel
@@ -221,12 +223,10 @@ def task_run_bane_and_aegean(
     """
     if isinstance(image, WSCleanResult):
         assert image.image_set is not None, "Image set attribute unset. "
-        image_paths = image.image_set.image
-
-        logger.info(f"Have extracted image: {image_paths}")
+        logger.info(f"Have extracted image: {image.image_set.image}")
 
         # For the moment, will only source find on an MFS image
-        image_paths = [image for image in image_paths if ".MFS." in str(image)]
+        image_paths = list(image.image_set.mfs_images)
         assert len(image_paths) == 1, (
             "More than one image found after filter_str for MFS only images. "
         )
@@ -541,9 +541,7 @@ def task_get_cube_common_beam(
                 f"No image_set for {wsclean_result.ms} found. Has imager finished?"
             )
             continue
-        images_to_consider.extend(wsclean_result.image_set.image)
-
-    images_to_consider = get_fits_cube_from_paths(paths=images_to_consider)
+        images_to_consider.extend(wsclean_result.image_set.cube_images)
 
     logger.info(
         f"Considering {len(images_to_consider)} images across {len(wsclean_results)} outputs. "
@@ -561,6 +559,7 @@ def task_convolve_cube(
     cutoff: float = 60,
     mode: Literal["image"] = "image",
     convol_suffix_str: str = "conv",
+    executor_type: Literal["thread", "process", "mpi"] = "thread",
 ) -> Collection[Path]:
     """Convolve images to a specified resolution
 
@@ -569,6 +568,7 @@ def task_convolve_cube(
         beam_shapes (BeamShape): The shape images will be convolved to
         cutoff (float, optional): Maximum major beam axis an image is allowed to have before it will not be convolved. Defaults to 60.
         convol_suffix_str (str, optional): The suffix added to the convolved images. Defaults to 'conv'.
+        executor_type (Literal["thread", "process", "mpi"], optional): How the per-channel convolution is distributed over cores. Defaults to 'thread'.
 
     Returns:
         Collection[Path]: Path to the output images that have been convolved.
@@ -580,13 +580,11 @@ def task_convolve_cube(
     supported_modes = ("image",)
     logger.info(f"Extracting {mode}")
     if mode == "image":
-        image_paths = list(wsclean_result.image_set.image)
+        logger.info(f"Extracting cubes from image_set {mode=}")
+        image_paths = list(wsclean_result.image_set.cube_images)
     else:
         raise ValueError(f"{mode=} is not supported. Known modes are {supported_modes}")
 
-    logger.info(f"Extracting cubes from image_set {mode=}")
-    image_paths = get_fits_cube_from_paths(paths=image_paths)
-
     # It is possible depending on how aggressively cleaning image products are deleted that these
     # some cleaning products (e.g. residuals) do not exist. There are a number of ways one could consider
     # handling this. The pirate in me feels like less is more, so an error will be enough. Keeping
@@ -598,14 +596,140 @@ def task_convolve_cube(
 
     logger.info(f"Will convolve {image_paths}")
 
+    # The per-channel convolution is the dominant compute step of cube mode
+    # and each plane is independent. The thread executor is the default as
+    # this task runs on daemonic dask workers, which cannot spawn the child
+    # processes the process executor needs. Callers in fork-friendly
+    # contexts may opt into "process" to sidestep the GIL.
     return convolve_cubes(
         cube_paths=image_paths,
         beam_shapes=beam_shapes,
         cutoff=cutoff,
         convol_suffix=convol_suffix_str,
+        executor_type=executor_type,
+    )
+
+
+_FITS_BLOCK_SIZE = 2880
+"""FITS files are organised in records of this many bytes"""
+_FITS_END_CARD = b"END" + b" " * 77
+"""The padded card that terminates a FITS header"""
+
+
+def _describe_beam_of_image(image_path: Path) -> str:
+    """Summarise the restoring beam of an image by reading only its primary
+    header. Results are memoised against the file's modification time, so
+    repeated visits to the same image across self-cal rounds within a worker
+    skip the read entirely.
+
+    Args:
+        image_path (Path): The FITS image whose beam will be summarised
+
+    Returns:
+        str: A short description of the restoring beam suitable for logging
+    """
+    return _describe_beam_of_image_cached(
+        image_path_str=str(image_path), mtime_ns=image_path.stat().st_mtime_ns
     )
 
 
+@lru_cache(maxsize=4096)
+def _describe_beam_of_image_cached(image_path_str: str, mtime_ns: int) -> str:
+    """Back the beam summaries of ``_describe_beam_of_image``. FITS blocks are
+    read directly until the END card is seen, avoiding the full HDU scan
+    ``fits.getheader`` would otherwise perform.
+
+    Args:
+        image_path_str (str): The FITS image whose beam will be summarised
+        mtime_ns (int): Modification time of the image, part of the cache key
+
+    Returns:
+        str: A short description of the restoring beam suitable for logging
+    """
+    image_path = Path(image_path_str)
+    # experience has shown that astropy units do not always work correctly
+    # in a multiprocessing / dask environment. The unit registry does not
+    # seem to serialise correctly, and we can get weird arcsecond is not
+    # compatible with arcsecond type errors. Import here in an attempt
+    # to minimise
+    import astropy.units as u
+    from astropy.io import fits
+    from radio_beam import Beam
+
+    header_bytes = b""
+    with open(image_path, "rb") as in_file:
+        while block := in_file.read(_FITS_BLOCK_SIZE):
+            header_bytes += block
+            if _FITS_END_CARD in block:
+                break
+
+    image_beam = Beam.from_fits_header(fits.Header.fromstring(header_bytes.decode()))
+
+    return f"{image_path.name!s}: {image_beam.major.to(u.arcsecond)} {image_beam.minor.to(u.arcsecond)}  {image_beam.pa}"
+
+
+def _prefetch_fits_data(image_path: Path) -> None:
+    """Hint the kernel to read a FITS data payload into the page cache ahead
+    of time. The convolution that follows then starts from warm pages rather
+    than stalling on demand-paging each one. A best-effort operation - any
+    failure is ignored.
+
+    Args:
+        image_path (Path): The FITS image whose data will be prefetched
+    """
+    import mmap
+
+    from astropy.io import fits
+
+    if not hasattr(mmap.mmap, "madvise"):
+        return
+
+    try:
+        with fits.open(image_path, memmap=True, mode="denywrite") as open_fits:
+            data = open_fits[0].data
+            if data is None:
+                return
+            array_mmap = fits.util._get_array_mmap(data)
+            if array_mmap is not None:
+                array_mmap.madvise(mmap.MADV_SEQUENTIAL)
+                array_mmap.madvise(mmap.MADV_WILLNEED)
+    except (OSError, AttributeError, ValueError):
+        pass
+
+
+_CONVOL_MODE_EXTRACTORS: dict[str, Callable[[ImageSet], list[Path] | None]] = {
+    "image": lambda image_set: image_set.image,
+    "residual": lambda image_set: image_set.residual,
+}
+"""Maps a convolution mode onto the ImageSet attribute holding its paths.
+Adding a mode here makes it available to all the convolve tasks at once."""
+
+
+def _extract_convol_mode_paths(image_set: ImageSet, mode: str) -> list[Path]:
+    """Pull out the set of image paths from an ImageSet for a convolution mode.
+
+    Args:
+        image_set (ImageSet): The image set to draw paths from
+        mode (str): Which class of image product to extract
+
+    Raises:
+        ValueError: Raised when ``mode`` is not a recognised product type
+
+    Returns:
+        list[Path]: The paths corresponding to ``mode``
+    """
+    extractor = _CONVOL_MODE_EXTRACTORS.get(mode)
+    if extractor is None:
+        raise ValueError(
+            f"{mode=} is not supported. Known modes are {tuple(_CONVOL_MODE_EXTRACTORS)}"
+        )
+
+    image_paths = extractor(image_set)
+    assert image_paths is not None, f"{image_paths=}, which should not happen"
+
+    return list(image_paths)
+
+
 def convolve_image_set(
     image_set: ImageSet,
     beam_shape: BeamShape,
@@ -628,17 +752,8 @@ def convolve_image_set(
     Returns:
         Collection[Path]: Path to the output images that have been convolved.
     """
-    supported_modes = ("image", "residual")
     logger.info(f"Extracting {mode}")
-    if mode == "image":
-        image_paths = list(image_set.image)
-    elif mode == "residual":
-        assert image_set.residual is not None, (
-            f"{image_set.residual=}, which should not happen"
-        )
-        image_paths = list(image_set.residual)
-    else:
-        raise ValueError(f"{mode=} is not supported. Known modes are {supported_modes}")
+    image_paths = _extract_convol_mode_paths(image_set=image_set, mode=mode)
 
     if filter_str is not None:
         logger.info(f"Filtering images paths with {filter_str=}")
@@ -655,21 +770,22 @@ def convolve_image_set(
 
     logger.info(f"Will convolve {image_paths}")
 
-    # experience has shown that astropy units do not always work correctly
-    # in a multiprocessing / dask environment. The unit registry does not
-    # seem to serialise correctly, and we can get weird arcsecond is not
-    # compatible with arcsecond type errors. Import here in an attempt
-    # to minimise
-    import astropy.units as u
-    from astropy.io import fits
-    from radio_beam import Beam
-
-    # Print the beams out here for logging
-    for image_path in image_paths:
-        image_beam = Beam.from_fits_header(fits.getheader(str(image_path)))
-        logger.info(
-            f"{image_path.name!s}: {image_beam.major.to(u.arcsecond)} {image_beam.minor.to(u.arcsecond)}  {image_beam.pa}"
-        )
+    # Print the beams out here for logging. The header reads are overlapped
+    # through threads as on networked file systems each open is a round trip.
+    # While at it, start pulling the image data into the page cache so the
+    # convolution below is not read-stalled on its first pass
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        prefetches = [
+            executor.submit(_prefetch_fits_data, image_path)
+            for image_path in image_paths
+        ]
+        # The summaries involve header reads and unit conversions - no need
+        # to pay for them when nothing would be emitted
+        if logger.isEnabledFor(logging.INFO):
+            for beam_description in executor.map(_describe_beam_of_image, image_paths):
+                logger.info(beam_description)
+        for prefetch in prefetches:
+            prefetch.result()
 
     convolved_images = convolve_images(
         image_paths=image_paths,
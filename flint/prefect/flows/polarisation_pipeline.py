@@ -13,6 +13,7 @@ from flint.configuration import (
     get_options_from_strategy,
     load_and_copy_strategy,
 )
+from flint.convol import BeamShape
 from flint.exceptions import MSError
 from flint.imager.wsclean import (
     ImageSet,
@@ -166,13 +167,22 @@ def process_science_fields_pol(
                 image_sets_list.append(_image_set)
         image_sets_dict[polarisation] = _image_sets
 
-    merged_image_set = task_merge_image_sets.submit(image_sets=image_sets_list)
+    if pol_field_options.fixed_beam_shape:
+        # No need to dispatch a task (and wait on every image set) just to
+        # return the shape we already have in hand
+        common_beam_shape = BeamShape(
+            bmaj_arcsec=pol_field_options.fixed_beam_shape[0],
+            bmin_arcsec=pol_field_options.fixed_beam_shape[1],
+            bpa_deg=pol_field_options.fixed_beam_shape[2],
+        )
+        logger.info(f"Using fixed {common_beam_shape=}")
+    else:
+        merged_image_set = task_merge_image_sets.submit(image_sets=image_sets_list)
 
-    common_beam_shape = task_get_common_beam_from_image_set.submit(
-        image_set=merged_image_set,
-        cutoff=pol_field_options.beam_cutoff,
-        fixed_beam_shape=pol_field_options.fixed_beam_shape,
-    )
+        common_beam_shape = task_get_common_beam_from_image_set.submit(
+            image_set=merged_image_set,
+            cutoff=pol_field_options.beam_cutoff,
+        )
 
     stokes_beam_cubes: dict[str, list[PrefectFuture[Path]]] = {}
     for polarisation, image_set_list in image_sets_dict.items():
@@ -9,6 +9,7 @@ import os
 import shutil
 import signal
 import subprocess
+import tarfile
 import uuid
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -42,6 +43,11 @@ def flatten_items(items: list[Any]) -> list[Any]:
     Returns:
         list[Any]: Flattened items
     """
+    # The common case is a flat list of paths - no need for the
+    # per-element recursion and appends when nothing is nested
+    if not any(isinstance(e, (list, tuple)) for e in items):
+        return list(items)
+
     flat_items = []
 
     def _flatten(nested):
@@ -634,6 +640,76 @@ def estimate_image_centre(image_path: Path) -> SkyCoord:
     return centre_sky
 
 
+def _tar_folder_sendfile(in_path: Path, out_tar: Path) -> None:
+    """Create an uncompressed tar archive of a directory, pushing file
+    payloads with ``os.sendfile`` so bytes move kernel-side rather than
+    through python-level read/write buffers. Arcnames match what
+    ``shutil.make_archive(base_dir=in_path)`` would have produced.
+
+    Args:
+        in_path (Path): The directory to archive
+        out_tar (Path): Where the tarball will be written
+    """
+    block_size = tarfile.BLOCKSIZE
+    arc_root = str(in_path).lstrip("/")
+
+    def _tar_info_for(path: Path, arcname: str) -> tarfile.TarInfo:
+        if path.is_symlink() or not (path.is_dir() or path.is_file()):
+            raise OSError(f"{path} is not a regular file or directory")
+        stat = path.lstat()
+        tar_info = tarfile.TarInfo(name=arcname)
+        tar_info.mode = stat.st_mode & 0o7777
+        tar_info.mtime = int(stat.st_mtime)
+        tar_info.uid = stat.st_uid
+        tar_info.gid = stat.st_gid
+        if path.is_dir():
+            tar_info.type = tarfile.DIRTYPE
+        else:
+            tar_info.size = stat.st_size
+        return tar_info
+
+    # Unbuffered so the header writes and the sendfile calls below agree
+    # on where the file offset is
+    with open(out_tar, "wb", buffering=0) as out_file:
+        out_fd = out_file.fileno()
+
+        for dir_path, dir_names, file_names in os.walk(in_path):
+            dir_names.sort()
+            relative_dir = os.path.relpath(dir_path, in_path)
+            arc_dir = (
+                arc_root
+                if relative_dir == "."
+                else f"{arc_root}/{relative_dir.replace(os.sep, '/')}"
+            )
+            dir_info = _tar_info_for(path=Path(dir_path), arcname=arc_dir)
+            out_file.write(dir_info.tobuf(format=tarfile.GNU_FORMAT))
+
+            for file_name in sorted(file_names):
+                file_path = Path(dir_path) / file_name
+                file_info = _tar_info_for(
+                    path=file_path, arcname=f"{arc_dir}/{file_name}"
+                )
+                out_file.write(file_info.tobuf(format=tarfile.GNU_FORMAT))
+
+                with open(file_path, "rb") as src_file:
+                    src_fd = src_file.fileno()
+                    offset = 0
+                    remaining = file_info.size
+                    while remaining > 0:
+                        sent = os.sendfile(out_fd, src_fd, offset, remaining)
+                        if sent == 0:
+                            raise OSError(f"Unexpected end of file in {file_path}")
+                        offset += sent
+                        remaining -= sent
+
+                padding = -file_info.size % block_size
+                if padding:
+                    out_file.write(b"\0" * padding)
+
+        # A tar stream is terminated by two zeroed blocks
+        out_file.write(b"\0" * (2 * block_size))
+
+
 def zip_folder(
     in_path: Path, out_zip: Path | None = None, archive_format: str = "tar"
 ) -> Path:
@@ -652,7 +728,22 @@ def zip_folder(
 
     if in_path.exists():
         logger.info(f"Zipping {in_path}.")
-        shutil.make_archive(str(out_zip), format=archive_format, base_dir=str(in_path))
+        if archive_format == "tar" and hasattr(os, "sendfile"):
+            out_tar = Path(f"{out_zip!s}.tar")
+            try:
+                _tar_folder_sendfile(in_path=in_path, out_tar=out_tar)
+            except OSError as error:
+                logger.warning(
+                    f"sendfile tar of {in_path} failed ({error}), falling back to make_archive"
+                )
+                out_tar.unlink(missing_ok=True)
+                shutil.make_archive(
+                    str(out_zip), format=archive_format, base_dir=str(in_path)
+                )
+        else:
+            shutil.make_archive(
+                str(out_zip), format=archive_format, base_dir=str(in_path)
+            )
         remove_files_folders(in_path)
     else:
         logger.warning(f"{in_path=} does not exist... Not archiving. ")
@@ -11,6 +11,7 @@ from pydantic import ValidationError
 
 from flint.options import MS
 from flint.peel.jolly import (
+    _maximum_sun_elevation,
     jolly_roger_tractor,
 )
 
@@ -25,6 +26,31 @@ def test_raise_bad_tukey_options() -> None:
         )
 
 
+def test_maximum_sun_elevation(ms_example) -> None:
+    """The sun altitude pre-check should return a sane elevation"""
+
+    max_elevation = _maximum_sun_elevation(ms_path=Path(ms_example))
+    assert -90.0 <= max_elevation <= 90.0
+
+
+def test_tukey_tractor_elevation_gate(ms_example, monkeypatch) -> None:
+    """The elevation pre-check should skip the tractor when the sun stays
+    below the cut, and run it when the sun rises above it"""
+
+    from flint.peel import jolly
+
+    ms_path = Path(ms_example)
+    tukey_tractor_options = TukeyTractorOptions(elevation_cut_deg=20.0)
+
+    monkeypatch.setattr(jolly, "_maximum_sun_elevation", lambda ms_path: 5.0)
+    ms = jolly_roger_tractor(ms=ms_path, tukey_tractor_options=tukey_tractor_options)
+    assert ms.column != tukey_tractor_options.output_column
+
+    monkeypatch.setattr(jolly, "_maximum_sun_elevation", lambda ms_path: 45.0)
+    ms = jolly_roger_tractor(ms=ms_path, tukey_tractor_options=tukey_tractor_options)
+    assert ms.column == tukey_tractor_options.output_column
+
+
 def test_tukey_tractor(ms_example) -> None:
     """Run the tukey tractor to assess for simple errors"""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 import os
+import tarfile
 import time
 from pathlib import Path
 from typing import Any
@@ -34,6 +35,7 @@ from flint.utils import (
     parse_environment_variables,
     temporarily_move_into,
     timelimit_on_context,
+    zip_folder,
 )
 
 
@@ -48,6 +50,41 @@ def test_flatten_items():
     assert items == flatten_items(items=items)
 
 
+def test_zip_folder_tar_roundtrip(tmpdir):
+    """Tar a small tree with the sendfile writer and make sure a plain
+    tarfile extraction reproduces it exactly"""
+    source_dir = Path(tmpdir) / "to_archive"
+    (source_dir / "sub_dir").mkdir(parents=True)
+    (source_dir / "a_file.txt").write_bytes(b"avast ye" * 1024)
+    (source_dir / "empty_file.txt").touch()
+    (source_dir / "sub_dir" / "nested_file.txt").write_bytes(b"pieces of eight")
+
+    expected_contents = {
+        str(path.relative_to(source_dir)): path.read_bytes()
+        for path in source_dir.rglob("*")
+        if path.is_file()
+    }
+
+    tar_path = Path(zip_folder(in_path=source_dir).with_suffix(".tar"))
+    assert tar_path.exists()
+    assert not source_dir.exists()
+
+    extract_dir = Path(tmpdir) / "extracted"
+    with tarfile.open(tar_path) as tar:
+        tar.extractall(path=extract_dir)
+
+    # Arcnames mirror what shutil.make_archive(base_dir=in_path) produces
+    extracted_root = extract_dir / str(source_dir).lstrip("/")
+    extracted_contents = {
+        str(path.relative_to(extracted_root)): path.read_bytes()
+        for path in extracted_root.rglob("*")
+        if path.is_file()
+    }
+    assert extracted_contents == expected_contents
+    assert extracted_contents["empty_file.txt"] == b""
+    assert (extracted_root / "sub_dir").is_dir()
+
+
 def some_long_function(minimum_time=5):
     t1 = time.time()
     while time.time() - t1 < minimum_time: